@@ -2,7 +2,8 @@
 
 from flask import Blueprint, request, jsonify
 from aidm_server.database import db
-from aidm_server.models import Campaign
+from aidm_server.models import Campaign, Session
+from aidm_server.blueprints.sessions import serialize_session
 from datetime import datetime
 import json
 import logging
@@ -91,3 +92,39 @@ def get_campaign(campaign_id):
     except Exception as e:
         logging.error(f"Failed to get campaign: {str(e)}")
         return jsonify({"error": "Failed to get campaign"}), 400
+
+@campaigns_bp.route('/<int:campaign_id>/bootstrap', methods=['GET'])
+def bootstrap_campaign(campaign_id):
+    """
+    Return everything a client needs to resume a campaign in one call.
+
+    Combines the campaign's session list with a server health flag and the
+    default IDs to use, so clients don't need separate round-trips on startup.
+
+    Args:
+        campaign_id (int): The ID of the campaign to bootstrap.
+
+    Returns:
+        JSON response with the sessions, health flag and defaults,
+        or an error message if the campaign is not found.
+    """
+    try:
+        campaign = db.session.get(Campaign, campaign_id)
+        if not campaign:
+            logging.warning(f"Campaign not found: ID {campaign_id}")
+            return jsonify({"error": "Campaign not found"}), 404
+
+        sessions = Session.query.filter_by(campaign_id=campaign_id).all()
+        data = {
+            "server_ok": True,
+            "sessions": [serialize_session(s) for s in sessions],
+            "defaults": {
+                "campaign_id": campaign.campaign_id,
+                "world_id": campaign.world_id
+            }
+        }
+        logging.info(f"Campaign bootstrap retrieved: ID {campaign_id}")
+        return jsonify(data)
+    except Exception as e:
+        logging.error(f"Failed to bootstrap campaign: {str(e)}")
+        return jsonify({"error": "Failed to bootstrap campaign"}), 400
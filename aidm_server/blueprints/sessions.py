@@ -33,6 +33,54 @@ def start_new_session():
         logging.error(f"Failed to start session: {str(e)}")
         return jsonify({"error": "Failed to start session"}), 400
 
+def serialize_session(s):
+    """
+    Convert a Session into the JSON-ready dict used by session listings.
+
+    Args:
+        s (Session): The session to serialize.
+
+    Returns:
+        dict: The session's public fields.
+    """
+    return {
+        "session_id": s.session_id,
+        "campaign_id": s.campaign_id,
+        "created_at": s.created_at.isoformat() if s.created_at else None,
+        "created_at_display": s.created_at.strftime('%Y-%m-%d %H:%M:%S') if s.created_at else None,
+        "state_snapshot": s.state_snapshot
+    }
+
+def finalize_session(session_obj):
+    """
+    Generate a recap for a session and store it in the session's snapshot.
+
+    Shared by the /end endpoint and the Socket.IO send_message handler
+    when a player's final message is sent with finalize=True.
+
+    Args:
+        session_obj (Session): The session to end.
+
+    Returns:
+        str: The generated recap.
+    """
+    full_log = get_full_session_log(session_obj.session_id)
+
+    from aidm_server.llm import query_gpt
+
+    recap_prompt = (
+        "Please provide a concise summary of this D&D session, highlighting key events, "
+        "important decisions, and any significant character developments:\n\n" + full_log
+    )
+    recap = query_gpt(prompt=recap_prompt, system_message="You are a D&D session summarizer.")
+    session_obj.state_snapshot = jsonify({
+        "recap": recap,
+        "ended_at": datetime.utcnow().isoformat()
+    }).data.decode("utf-8")
+    db.session.commit()
+    logging.info(f"Session ended with ID: {session_obj.session_id}")
+    return recap
+
 @sessions_bp.route('/<int:session_id>/end', methods=['POST'])
 def end_game_session(session_id):
     """
@@ -49,22 +97,8 @@ def end_game_session(session_id):
         logging.warning(f"Session not found: ID {session_id}")
         return jsonify({"error": "Session not found"}), 404
 
-    full_log = get_full_session_log(session_id)
-    
-    from aidm_server.llm import query_gpt
-
-    recap_prompt = (
-        "Please provide a concise summary of this D&D session, highlighting key events, "
-        "important decisions, and any significant character developments:\n\n" + full_log
-    )
     try:
-        recap = query_gpt(prompt=recap_prompt, system_message="You are a D&D session summarizer.")
-        session_obj.state_snapshot = jsonify({
-            "recap": recap,
-            "ended_at": datetime.utcnow().isoformat()
-        }).data.decode("utf-8")
-        db.session.commit()
-        logging.info(f"Session ended with ID: {session_id}")
+        recap = finalize_session(session_obj)
         return jsonify({"recap": recap})
     except Exception as e:
         logging.error(f"Failed to end session: {str(e)}")
@@ -85,12 +119,7 @@ def list_campaign_sessions(campaign_id):
         sessions = Session.query.filter_by(campaign_id=campaign_id).all()
         results = []
         for s in sessions:
-            results.append({
-                "session_id": s.session_id,
-                "campaign_id": s.campaign_id,
-                "created_at": s.created_at.isoformat() if s.created_at else None,
-                "state_snapshot": s.state_snapshot
-            })
+            results.append(serialize_session(s))
         logging.info(f"Sessions listed for campaign ID: {campaign_id}")
         return jsonify(results)
     except Exception as e:
@@ -14,6 +14,7 @@ from aidm_server.llm import (
     query_dm_function_stream,
     build_dm_context
 )
+from aidm_server.blueprints.sessions import finalize_session
 
 # Track active players across sessions: { session_id: { player_id: {...player_data...} } }
 active_players = {}
@@ -44,7 +45,8 @@ def register_socketio_events(socketio):
             emit('error', {'message': 'Session ID is required to join.'})
             return
 
-        join_room(str(session_id))
+        room = str(session_id)
+        join_room(room)
 
         # Record this connection (for disconnect tracking)
         socketio_connections[request.sid] = {
@@ -67,16 +69,16 @@ def register_socketio_events(socketio):
             active_players[session_id][player_id] = player_data
 
             # Broadcast that this player joined
-            emit('player_joined', player_data, room=str(session_id))
+            emit('player_joined', player_data, room=room)
 
             # Emit the updated list
             all_players = list(active_players[session_id].values())
-            emit('active_players', all_players, room=str(session_id))
+            emit('active_players', all_players, room=room)
 
         # Optionally, also broadcast a general chat message
         emit('new_message', {
             'message': f"A new player joined session {session_id}!"
-        }, room=str(session_id))
+        }, room=room)
 
     @socketio.on('leave_session')
     def handle_leave_session(data):
@@ -87,15 +89,16 @@ def register_socketio_events(socketio):
             emit('error', {'message': 'session_id and player_id are required'})
             return
 
-        leave_room(str(session_id))
+        room = str(session_id)
+        leave_room(room)
 
         # Remove from active players
         if session_id in active_players and player_id in active_players[session_id]:
             del active_players[session_id][player_id]
-            emit('player_left', {'id': player_id}, room=str(session_id))
+            emit('player_left', {'id': player_id}, room=room)
 
             updated_players = list(active_players[session_id].values())
-            emit('active_players', updated_players, room=str(session_id))
+            emit('active_players', updated_players, room=room)
 
         # Clean up the socket->session mapping
         if request.sid in socketio_connections:
@@ -111,13 +114,14 @@ def register_socketio_events(socketio):
         if connection_info:
             session_id = connection_info['session_id']
             player_id = connection_info['player_id']
+            room = str(session_id)
 
             if session_id in active_players and player_id in active_players[session_id]:
                 del active_players[session_id][player_id]
-                emit('player_left', {'id': player_id}, room=str(session_id))
+                emit('player_left', {'id': player_id}, room=room)
 
                 updated_players = list(active_players[session_id].values())
-                emit('active_players', updated_players, room=str(session_id))
+                emit('active_players', updated_players, room=room)
 
     @socketio.on('send_message')
     def handle_send_message(data):
@@ -133,6 +137,8 @@ def register_socketio_events(socketio):
         campaign_id = data['campaign_id']
         world_id = data['world_id']
         player_id = data['player_id']
+        # Room name is reused for every emit below
+        room = str(session_id)
 
         # Validate player
         player = db.session.get(Player, player_id)
@@ -165,7 +171,7 @@ def register_socketio_events(socketio):
         emit('new_message', {
             'message': data['message'],
             'speaker': player_label
-        }, room=str(session_id), include_self=False)
+        }, room=room, include_self=False)
 
         # Store in session log
         player_msg_entry = SessionLogEntry(
@@ -193,7 +199,7 @@ def register_socketio_events(socketio):
                 emit('segment_triggered', {
                     'segment_id': seg.segment_id,
                     'title': seg.title
-                }, room=str(session_id))
+                }, room=room)
 
                 log_entry = SessionLogEntry(
                     session_id=session_id,
@@ -211,9 +217,10 @@ def register_socketio_events(socketio):
         }
         context = build_dm_context(world_id, campaign_id, session_id)
 
-        emit('dm_response_start', {'session_id': session_id}, room=str(session_id))
+        emit('dm_response_start', {'session_id': session_id}, room=room)
 
         dm_response_text = ""
+        generation_ok = False
 
         try:
             for chunk in query_dm_function_stream(user_input, context, speaking_player=speaking_player):
@@ -221,16 +228,17 @@ def register_socketio_events(socketio):
                     emit('dm_chunk', {
                         'chunk': chunk,
                         'session_id': session_id
-                    }, room=str(session_id))
+                    }, room=room)
                     socketio.sleep(0)
                     dm_response_text += chunk
+            generation_ok = True
 
         except Exception as e:
             emit('error', {
                 'message': f'Error generating response: {str(e)}'
-            }, room=str(session_id))
+            }, room=room)
         finally:
-            emit('dm_response_end', {'session_id': session_id}, room=str(session_id))
+            emit('dm_response_end', {'session_id': session_id}, room=room)
 
         if dm_response_text.strip():
             final_dm_entry = SessionLogEntry(
@@ -243,4 +251,25 @@ def register_socketio_events(socketio):
 
         emit('session_log_update', {
             'session_id': session_id
-        }, room=str(session_id))
+        }, room=room)
+
+        # Optionally end the session with this turn, saving the client a separate /end call
+        if data.get('finalize'):
+            # Don't end the session on a turn the DM never answered
+            if not (generation_ok and dm_response_text.strip()):
+                emit('error', {
+                    'message': 'Session was not ended: DM response failed. Retry or call /end.',
+                    'session_id': session_id
+                }, room=room)
+                return
+
+            try:
+                recap = finalize_session(session_obj)
+                emit('session_recap', {
+                    'session_id': session_id,
+                    'recap': recap
+                }, room=room)
+            except Exception as e:
+                emit('error', {
+                    'message': f'Error ending session: {str(e)}'
+                }, room=room)
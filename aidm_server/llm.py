@@ -24,7 +24,8 @@ api_key = os.getenv("GOOGLE_GENAI_API_KEY")
 if not api_key:
     raise ValueError("GOOGLE_GENAI_API_KEY environment variable is not set")
 
-genai.configure(api_key=api_key)
+# REST transport keeps LLM calls cooperative under eventlet (gRPC blocks the hub)
+genai.configure(api_key=api_key, transport="rest")
 model = genai.GenerativeModel("gemini-exp-1206")
 
 
@@ -175,13 +176,11 @@ If an action warrants a dice roll, explicitly request it from the player.
         f"PLAYER INPUT:\n{user_input}\n"
     )
 
-    try:
-        response = model.generate_content(full_prompt, stream=True)
-        for chunk in response:
-            if chunk.text:
-                yield chunk.text.strip()
-    except Exception as e:
-        yield f"Error during streaming: {str(e)}"
+    # Errors propagate to the caller so a failed turn isn't mistaken for DM text
+    response = model.generate_content(full_prompt, stream=True)
+    for chunk in response:
+        if chunk.text:
+            yield chunk.text.strip()
 
 
 def query_gpt(prompt, system_message=None):
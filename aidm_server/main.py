@@ -1,8 +1,23 @@
 # main.py
 
+import argparse
 import os
+
+# eventlet has to patch the standard library before anything else imports it
+ASYNC_MODE = os.getenv("SOCKETIO_ASYNC_MODE", "eventlet")
+if ASYNC_MODE not in ("eventlet", "threading"):
+    raise ValueError(
+        f"Unsupported SOCKETIO_ASYNC_MODE {ASYNC_MODE!r}; use 'eventlet' or 'threading'"
+    )
+if ASYNC_MODE == "eventlet":
+    import eventlet
+    eventlet.monkey_patch()
+
+import orjson
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider, JSONProvider
 from flask_cors import CORS
+from flask_compress import Compress
 from flask_socketio import SocketIO
 import logging
 
@@ -13,13 +28,51 @@ from aidm_server.blueprints.players import players_bp
 from aidm_server.blueprints.sessions import sessions_bp
 from aidm_server.blueprints.maps import maps_bp
 from aidm_server.blueprints.socketio_events import register_socketio_events
-from aidm_server.blueprints.admin import configure_admin
 # NEW:
 from aidm_server.blueprints.segments import segments_bp
 
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider backed by orjson, used for request parsing and jsonify().
+    Types orjson can't handle natively fall back to Flask's default encoder,
+    and calls with options orjson doesn't support go to Flask's provider.
+    """
+
+    def __init__(self, app):
+        super().__init__(app)
+        self._fallback = DefaultJSONProvider(app)
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        extra = dict(kwargs)
+        if extra.pop("sort_keys", False):
+            option |= orjson.OPT_SORT_KEYS
+        indent = extra.pop("indent", None)
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        elif indent is not None:
+            extra["indent"] = indent
+        if extra:
+            return self._fallback.dumps(obj, **kwargs)
+
+        return orjson.dumps(
+            obj,
+            default=DefaultJSONProvider.default,
+            option=option
+        ).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return self._fallback.loads(s, **kwargs)
+        return orjson.loads(s)
+
 def create_app():
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     CORS(app)
+    # Only compress payloads big enough to benefit (session lists, recaps)
+    app.config['COMPRESS_MIN_SIZE'] = 512
+    Compress(app)
     app.secret_key = os.getenv("FLASK_SECRET_KEY") or "my_dev_secret"
 
     init_db(app)
@@ -33,16 +86,32 @@ def create_app():
     # Register our new segments blueprint
     app.register_blueprint(segments_bp, url_prefix='/api/segments')
 
-    # Flask-Admin setup
-    configure_admin(app, db)
+    @app.route('/healthz', methods=['GET', 'HEAD'])
+    def healthz():
+        """Cheap liveness probe for clients; no DB or template work."""
+        return b'{"ok":1}', 200, {'Content-Type': 'application/json'}
+
+    # Flask-Admin setup (set ENABLE_ADMIN=0 to skip loading it)
+    if os.getenv("ENABLE_ADMIN", "1") != "0":
+        from aidm_server.blueprints.admin import configure_admin
+        configure_admin(app, db)
 
     return app
 
 app = create_app()
-socketio = SocketIO(app, cors_allowed_origins="*")
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode=ASYNC_MODE)
 register_socketio_events(socketio)
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the AI-DM server.")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--debug', action='store_true', default=os.getenv("FLASK_DEBUG") == "1")
+    return parser.parse_args()
+
 if __name__ == '__main__':
+    args = parse_args()
+
     with app.app_context():
         try:
             db.create_all()
@@ -52,7 +121,10 @@ if __name__ == '__main__':
             raise
 
     try:
-        socketio.run(app, debug=True, port=5000, allow_unsafe_werkzeug=True)
+        socketio.run(
+            app, host=args.host, port=args.port, debug=args.debug,
+            allow_unsafe_werkzeug=(ASYNC_MODE == "threading")
+        )
     except Exception as e:
         logging.error(f"Error running the server: {str(e)}")
         raise